@@ -1,15 +1,25 @@
-import json
 import os
-import queue
 import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
 from urllib.parse import urlencode
+from xml.sax.saxutils import escape, quoteattr
 
+import orjson
+import requests
 from dotenv import load_dotenv
 from flask import Flask, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse, Dial, Say
 from twilio.base.exceptions import TwilioException, TwilioRestException
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,24 +28,92 @@ logger = logging.getLogger(__name__)
 # Load environment variables from project root .env if present
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", ".env"))
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.get_json"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        # Sort keys like DefaultJSONProvider (sort_keys = True) so output order is unchanged
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Application settings, read from the environment once at startup"""
+    
+    frontend_url: str
+    backend_url: str
+    cors_origin: str
+    account_sid: str
+    auth_token: str
+    api_key_sid: str
+    api_key_secret: str
+    number_a: str
+    number_b: str
+    # Seconds between background Twilio connection checks
+    check_ttl: float
+    # Socket/read timeout (seconds) for Twilio REST requests
+    http_timeout: float
+    secret_key: str
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
+        return cls(
+            frontend_url=frontend_url,
+            backend_url=os.getenv("BACKEND_URL", "http://127.0.0.1:5000"),
+            cors_origin=os.getenv("CORS_ORIGIN", frontend_url),
+            account_sid=os.getenv("TWILIO_ACCOUNT_SID", ""),
+            auth_token=os.getenv("TWILIO_AUTH_TOKEN", ""),
+            api_key_sid=os.getenv("TWILIO_API_KEY_SID", ""),
+            api_key_secret=os.getenv("TWILIO_API_KEY_SECRET", ""),
+            number_a=os.getenv("TWILIO_NUMBER_A", ""),
+            number_b=os.getenv("TWILIO_NUMBER_B", ""),
+            # Never below a second, so a zero or negative value can't make the
+            # refresh thread hit the Twilio API back to back
+            check_ttl=max(float(os.getenv("TWILIO_CHECK_TTL", "30")), 1.0),
+            http_timeout=float(os.getenv("TWILIO_HTTP_TIMEOUT", "10")),
+            secret_key=os.getenv("FLASK_SECRET", "dev-secret-change-me"),
+        )
+
+
+CFG = Config.from_env()
+
+app.config["SECRET_KEY"] = CFG.secret_key
 
-# Configuration
-FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
-BACKEND_URL = os.getenv("BACKEND_URL", "http://127.0.0.1:5000")
-CORS_ORIGIN = os.getenv("CORS_ORIGIN", FRONTEND_URL)
+CORS(app, resources={r"/api/*": {"origins": CFG.cors_origin}})
 
-TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID", "")
-TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN", "")
-TWILIO_API_KEY_SID = os.getenv("TWILIO_API_KEY_SID", "")
-TWILIO_API_KEY_SECRET = os.getenv("TWILIO_API_KEY_SECRET", "")
 
-TWILIO_NUMBER_A = os.getenv("TWILIO_NUMBER_A", "")
-TWILIO_NUMBER_B = os.getenv("TWILIO_NUMBER_B", "")
+def build_twilio_http_client() -> TwilioHttpClient:
+    """Build one pooled HTTP client shared by every Twilio client.
 
-app.config["SECRET_KEY"] = os.getenv("FLASK_SECRET", "dev-secret-change-me")
+    Each Client would otherwise get its own TwilioHttpClient session; sharing
+    one pool lets the Auth Token and API Key clients reuse the same keep-alive
+    connections, and adds urllib3 retries and a request timeout. Retries only
+    cover connection errors and idempotent methods, so a call is never created
+    twice.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    ))
+    http_client = TwilioHttpClient(timeout=CFG.http_timeout)
+    http_client.session = session
+    return http_client
 
-CORS(app, resources={r"/api/*": {"origins": CORS_ORIGIN}})
+
+twilio_http_client = build_twilio_http_client()
 
 
 class TwilioClientManager:
@@ -45,14 +123,15 @@ class TwilioClientManager:
         self.primary_client = None
         self.fallback_client = None
         self.current_method = None
+        self._last_result = (False, "Twilio connection not checked yet")
         self._initialize_clients()
     
     def _initialize_clients(self):
         """Initialize both authentication methods"""
         # Try Auth Token first (has full permissions, more reliable)
-        if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
+        if CFG.account_sid and CFG.auth_token:
             try:
-                self.primary_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+                self.primary_client = Client(CFG.account_sid, CFG.auth_token, http_client=twilio_http_client)
                 self.current_method = "auth_token"
                 logger.info("Primary Twilio client initialized with Auth Token authentication")
             except Exception as e:
@@ -60,9 +139,9 @@ class TwilioClientManager:
                 self.primary_client = None
         
         # Try API Key as fallback (more secure but may have permission restrictions)
-        if TWILIO_ACCOUNT_SID and TWILIO_API_KEY_SID and TWILIO_API_KEY_SECRET:
+        if CFG.account_sid and CFG.api_key_sid and CFG.api_key_secret:
             try:
-                self.fallback_client = Client(TWILIO_API_KEY_SID, TWILIO_API_KEY_SECRET, TWILIO_ACCOUNT_SID)
+                self.fallback_client = Client(CFG.api_key_sid, CFG.api_key_secret, CFG.account_sid, http_client=twilio_http_client)
                 if not self.primary_client:
                     self.current_method = "api_key"
                     logger.info("Fallback Twilio client initialized with API Key authentication")
@@ -74,66 +153,211 @@ class TwilioClientManager:
     
     def get_client(self):
         """Get the current working client"""
+        if self.current_method == "api_key" and self.fallback_client:
+            return self.fallback_client
         return self.primary_client or self.fallback_client
     
     def get_auth_method(self):
         """Get current authentication method"""
-        if self.primary_client:
-            return "auth_token"
-        elif self.fallback_client:
-            return "api_key"
-        return "none"
+        client = self.get_client()
+        if client is None:
+            return "none"
+        return "auth_token" if client is self.primary_client else "api_key"
     
     def test_connection(self):
-        """Test the current client connection"""
-        client = self.get_client()
+        """Test the current client connection and cache the result"""
+        self._last_result = self._probe_connection()
+        return self._last_result
+    
+    def connection_status(self):
+        """Get the last connection test result without any network I/O"""
+        return self._last_result
+    
+    def start_background_refresh(self):
+        """Keep the cached connection status fresh from a daemon thread"""
+        def refresh():
+            while True:
+                self.test_connection()
+                time.sleep(CFG.check_ttl)
+        
+        threading.Thread(target=refresh, name="twilio-connection-check", daemon=True).start()
+    
+    def _probe_connection(self, client=None):
+        """Check that Twilio accepts the current client's credentials.
+
+        Sends the same GET the SDK's fetch() would (region/edge hostname, auth,
+        headers and request hooks all come from the client), but streams the
+        response so a successful account body is never read or parsed.
+        """
+        client = client or self.get_client()
         if not client:
             return False, "No Twilio client available"
         
+        method = "GET"
+        url = client.get_hostname(f"{client.api.base_url}/2010-04-01/Accounts/{CFG.account_sid}.json")
         try:
-            # Try to fetch account info to test connection
-            account = client.api.accounts(TWILIO_ACCOUNT_SID).fetch()
-            return True, f"Connected using {self.get_auth_method()} authentication"
-        except TwilioRestException as e:
-            if e.code == 20003:  # Authentication error
-                # Try to switch to fallback if available
-                if self.primary_client and self.fallback_client and self.current_method == "auth_token":
-                    logger.warning("Auth Token authentication failed, switching to API Key")
-                    self.current_method = "api_key"
-                    return self.test_connection()
-                else:
-                    return False, f"Authentication failed: {e.msg}"
-            else:
-                return False, f"Twilio error: {e.msg}"
+            resp = twilio_http_client.session.request(
+                method,
+                url,
+                headers=client.get_headers(method, None),
+                auth=client.get_auth(None),
+                hooks=twilio_http_client.request_hooks,
+                timeout=CFG.http_timeout,
+                stream=True,
+            )
         except Exception as e:
             return False, f"Connection test failed: {str(e)}"
+        
+        try:
+            if resp.status_code == 200:
+                try:
+                    # Discard the body unread so the connection goes back to the pool
+                    resp.raw.drain_conn()
+                except Exception:
+                    # Twilio already answered; the connection just won't be reused
+                    pass
+                return True, f"Connected using {self.get_auth_method()} authentication"
+            
+            try:
+                error = resp.json()
+            except ValueError:
+                error = {}
+            code = error.get("code")
+            message = error.get("message") or f"HTTP {resp.status_code}"
+        finally:
+            resp.close()
+        
+        if code == 20003 or resp.status_code == 401:  # Authentication error
+            # Try to switch to fallback if available
+            if self.primary_client and self.fallback_client and self.current_method == "auth_token":
+                logger.warning("Auth Token authentication failed, switching to API Key")
+                self.current_method = "api_key"
+                return self._probe_connection(self.fallback_client)
+            return False, f"Authentication failed: {message}"
+        return False, f"Twilio error: {message}"
 
 
 # Initialize Twilio client manager
 twilio_manager = TwilioClientManager()
+twilio_manager.start_background_refresh()
+
+# Parts of the status payloads that can't change while the process runs, serialized
+# once and left open (no closing brace) so the dynamic fields can be appended
+HEALTH_STATIC_JSON = orjson.dumps({
+    "twilio_configured": bool(twilio_manager.get_client() and CFG.number_a and CFG.number_b),
+})[:-1]
+TWILIO_STATUS_STATIC_JSON = orjson.dumps({
+    "primary_client_available": bool(twilio_manager.primary_client),
+    "fallback_client_available": bool(twilio_manager.fallback_client),
+    "account_sid_configured": bool(CFG.account_sid),
+    "api_key_configured": bool(CFG.api_key_sid and CFG.api_key_secret),
+    "auth_token_configured": bool(CFG.auth_token),
+})[:-1]
+
+
+def static_json_response(static_json: bytes, dynamic: dict) -> Response:
+    """JSON response joining a prerendered static prefix with the dynamic fields"""
+    return Response(static_json + b"," + orjson.dumps(dynamic)[1:], mimetype="application/json")
+
+# Number of recent events kept in the shared log; a client that falls further
+# behind than this is disconnected (its EventSource then reconnects)
+SSE_BUFFER_SIZE = 1024
+# Bursts of events are coalesced into one write: up to this many events...
+SSE_BATCH_MAX = 16
+# ...or whatever arrives within this many seconds of the first one
+SSE_BATCH_WINDOW = 0.02
+# Maximum number of concurrently connected SSE clients
+SSE_MAX_SUBSCRIBERS = 100
+# Seconds an SSE stream may sit idle before writing a keep-alive comment; a
+# stream only notices a vanished client when a write to it fails
+SSE_PING_INTERVAL = 60
+# SSE comment frame: EventSource skips it, so it never reaches onmessage
+SSE_PING_FRAME = b": ping\n\n"
+
+
+class EventSubscriber:
+    """Read position of one Server-Sent Events client in the shared event log"""
+    
+    __slots__ = ("next_seq",)
+    
+    def __init__(self, next_seq: int):
+        # Sequence number of the next event this client should receive
+        self.next_seq = next_seq
+
+
+# Simple in-memory subscribers for Server-Sent Events, kept as an immutable tuple.
+# Connects and disconnects swap in a new tuple under subscribers_lock; readers
+# use whichever tuple is current without copying it or taking a lock.
+subscribers: tuple = ()
+subscribers_lock = threading.Lock()
+
+
+def add_subscriber(sub: EventSubscriber) -> bool:
+    """Register an SSE client, unless SSE_MAX_SUBSCRIBERS are already connected"""
+    global subscribers
+    with subscribers_lock:
+        if len(subscribers) >= SSE_MAX_SUBSCRIBERS:
+            return False
+        subscribers = subscribers + (sub,)
+        return True
+
+
+def remove_subscribers(*subs: EventSubscriber) -> None:
+    """Unregister SSE clients"""
+    global subscribers
+    with subscribers_lock:
+        subscribers = tuple(sub for sub in subscribers if sub not in subs)
+
+
+# One log of encoded SSE frames shared by every stream, as (seq, frame) pairs.
+# The dispatcher appends and wakes all streams under events_cv, so publishing an
+# event takes one lock no matter how many clients are connected, and each event
+# is serialized once rather than once per client.
+event_log = deque(maxlen=SSE_BUFFER_SIZE)
+next_event_seq = 0
+events_cv = threading.Condition()
 
-# Simple in-memory subscribers for Server-Sent Events
-subscribers = set()
+# Events waiting for the dispatcher thread to publish them to the log
+pending_events = queue.SimpleQueue()
 
 
 def broadcast_event(event_type: str, payload: dict) -> None:
-    data = {"event": event_type, "payload": payload}
-    for q in list(subscribers):
-        try:
-            q.put_nowait(data)
-        except Exception:
-            # Best-effort; skip on failure
-            pass
+    # Nobody is listening (e.g. the dashboard is closed); skip building the event
+    if not subscribers:
+        return
+    # A single enqueue, so webhook handlers return without touching the log
+    pending_events.put({"event": event_type, "payload": payload})
+
+
+def dispatch_events() -> None:
+    """Publish pending events to the shared event log (runs on a daemon thread)"""
+    global next_event_seq
+    while True:
+        batch = [pending_events.get()]
+        # Publish everything that queued up meanwhile with a single wake-up
+        while True:
+            try:
+                batch.append(pending_events.get_nowait())
+            except queue.Empty:
+                break
+        frames = [b"data: " + orjson.dumps(data) + b"\n\n" for data in batch]
+        with events_cv:
+            for frame in frames:
+                event_log.append((next_event_seq, frame))
+                next_event_seq += 1
+            events_cv.notify_all()
+
+
+threading.Thread(target=dispatch_events, name="sse-dispatcher", daemon=True).start()
 
 
 @app.get("/api/health")
 def health() -> Response:
-    # Test connection and get current status
-    is_connected, message = twilio_manager.test_connection()
+    # Cached status, kept fresh by the background refresh thread
+    is_connected, message = twilio_manager.connection_status()
     
-    return jsonify({
+    return static_json_response(HEALTH_STATIC_JSON, {
         "status": "ok" if is_connected else "error",
-        "twilio_configured": bool(twilio_manager.get_client() and TWILIO_NUMBER_A and TWILIO_NUMBER_B),
         "twilio_auth_method": twilio_manager.get_auth_method(),
         "twilio_connection_status": message,
         "twilio_connected": is_connected
@@ -142,20 +366,45 @@ def health() -> Response:
 
 @app.get("/api/events")
 def sse_events() -> Response:
-    q: queue.Queue = queue.Queue()
-    subscribers.add(q)
+    sub = EventSubscriber(next_event_seq)
+    if not add_subscriber(sub):
+        return jsonify({"error": "Too many event stream connections"}), 503
 
     def stream():
         try:
             # Immediate hello event so client knows we're connected
-            yield f"data: {json.dumps({'event': 'connected', 'payload': {}})}\n\n"
+            yield b"data: " + orjson.dumps({"event": "connected", "payload": {}}) + b"\n\n"
             while True:
-                data = q.get()
-                yield f"data: {json.dumps(data)}\n\n"
+                with events_cv:
+                    idle_deadline = time.monotonic() + SSE_PING_INTERVAL
+                    while sub.next_seq == next_event_seq:
+                        remaining = idle_deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        events_cv.wait(remaining)
+                    if sub.next_seq == next_event_seq:
+                        frames = [SSE_PING_FRAME]
+                    else:
+                        # Give the rest of a burst (e.g. ringing/answered) a moment to land
+                        deadline = time.monotonic() + SSE_BATCH_WINDOW
+                        while next_event_seq - sub.next_seq < SSE_BATCH_MAX:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            events_cv.wait(remaining)
+                        start = sub.next_seq - event_log[0][0]
+                        if start < 0:
+                            # Too slow to keep up; drop it rather than silently losing events
+                            return
+                        frames = [frame for _, frame in islice(event_log, start, start + SSE_BATCH_MAX)]
+                        sub.next_seq += len(frames)
+                # For an idle stream this is the ping; if the client has gone, the write
+                # fails and the server closes the generator, which unsubscribes it
+                yield b"".join(frames)
         except GeneratorExit:
             pass
         finally:
-            subscribers.discard(q)
+            remove_subscribers(sub)
 
     headers = {
         "Content-Type": "text/event-stream",
@@ -163,51 +412,68 @@ def sse_events() -> Response:
         "Connection": "keep-alive",
         "X-Accel-Buffering": "no",
     }
-    return Response(stream(), headers=headers)
+    # The stream yields ready-encoded bytes, so let the WSGI server write each chunk
+    # as is instead of running it through Werkzeug's per-chunk encoding wrapper
+    return Response(stream(), headers=headers, direct_passthrough=True)
+
+
+def _do_create(client: Client, **call_kwargs):
+    """Create a call with the given client, returning (call, None) or (None, TwilioRestException)"""
+    try:
+        return client.calls.create(**call_kwargs), None
+    except TwilioRestException as e:
+        return None, e
 
 
 @app.post("/api/call/connect")
 def create_outbound_call() -> Response:
-    # Test connection before proceeding
-    is_connected, message = twilio_manager.test_connection()
-    if not is_connected:
-        return jsonify({"error": f"Twilio connection failed: {message}"}), 500
-    
+    # No pre-flight connection test here: calls.create is the only Twilio round-trip
+    # on this path, and auth problems surface through its TwilioRestException below.
     client = twilio_manager.get_client()
     if client is None:
         return jsonify({"error": "Twilio is not configured. Check environment variables."}), 400
 
     body = request.get_json(silent=True) or {}
     customer_number = (body.get("customer_number") or "").strip()
-    agent_number = (body.get("agent_number") or TWILIO_NUMBER_B).strip()
+    agent_number = (body.get("agent_number") or CFG.number_b).strip()
 
     if not customer_number:
         return jsonify({"error": "customer_number is required"}), 400
     if not agent_number:
         return jsonify({"error": "agent_number is required (or TWILIO_NUMBER_B must be set)"}), 400
-    if not TWILIO_NUMBER_A:
+    if not CFG.number_a:
         return jsonify({"error": "TWILIO_NUMBER_A is not configured"}), 400
 
     # We'll first call the agent_number, and when they answer, Twilio will dial the
     # customer_number to connect both parties. We provide inline TwiML so Twilio does
     # not need to fetch our bridge URL.
-    bridge_twiml = (
-        f"<Response>"
-        f"<Dial callerId=\"{TWILIO_NUMBER_A}\">"
-        f"<Number>{customer_number}</Number>"
-        f"</Dial>"
-        f"</Response>"
-    )
+    bridge_twiml = BRIDGE_TWIML_TEMPLATE.format(customer=escape(customer_number))
+
+    call_kwargs = {
+        "to": agent_number,
+        "from_": CFG.number_a,
+        "twiml": bridge_twiml,
+        "status_callback": f"{CFG.backend_url}/api/voice/status",
+        "status_callback_event": ["initiated", "ringing", "answered", "completed"],
+        "status_callback_method": "POST",
+    }
 
     try:
-        call = client.calls.create(
-            to=agent_number,
-            from_=TWILIO_NUMBER_A,
-            twiml=bridge_twiml,
-            status_callback=f"{BACKEND_URL}/api/voice/status",
-            status_callback_event=["initiated", "ringing", "answered", "completed"],
-            status_callback_method="POST",
-        )
+        call, error = _do_create(client, **call_kwargs)
+        
+        # If this is an authentication error and we have a fallback, retry once with it
+        if (error is not None and error.code == 20003
+                and twilio_manager.fallback_client and client is twilio_manager.primary_client):
+            logger.error(f"Twilio error (code {error.code}): {error.msg}")
+            logger.info("Attempting to retry with fallback authentication")
+            twilio_manager.current_method = "api_key"
+            client = twilio_manager.fallback_client
+            call, error = _do_create(client, **call_kwargs)
+        
+        if error is not None:
+            error_msg = f"Twilio error (code {error.code}): {error.msg}"
+            logger.error(error_msg)
+            return jsonify({"error": error_msg}), 500
         
         auth_method = twilio_manager.get_auth_method()
         broadcast_event("call_initiated", {
@@ -224,83 +490,87 @@ def create_outbound_call() -> Response:
             "message": "Call initiated successfully"
         })
         
-    except TwilioRestException as e:
-        error_msg = f"Twilio error (code {e.code}): {e.msg}"
-        logger.error(error_msg)
-        
-        # If this is an authentication error and we have a fallback, try to switch
-        if e.code == 20003 and twilio_manager.fallback_client and twilio_manager.current_method == "auth_token":
-            logger.info("Attempting to retry with fallback authentication")
-            twilio_manager.current_method = "api_key"
-            # Recursive call to retry with fallback
-            return create_outbound_call()
-        
-        return jsonify({"error": error_msg}), 500
-        
     except Exception as exc:
         error_msg = f"Unexpected error: {str(exc)}"
         logger.error(error_msg)
         return jsonify({"error": error_msg}), 500
 
 
+TWIML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>'
+
+
+def dial_twiml(caller_id: str, number: str) -> str:
+    """Render TwiML that dials number, presenting caller_id"""
+    return (
+        f"{TWIML_DECLARATION}<Response>"
+        f"<Dial callerId={quoteattr(caller_id)}>"
+        f"<Number>{escape(number)}</Number>"
+        f"</Dial>"
+        f"</Response>"
+    )
+
+
+def say_twiml(message: str) -> str:
+    """Render TwiML that speaks message"""
+    return f"{TWIML_DECLARATION}<Response><Say>{escape(message)}</Say></Response>"
+
+
+# The configured numbers are fixed for the life of the process, so the webhook
+# responses are rendered once here instead of building a VoiceResponse per call.
+NO_DESTINATION_TWIML = say_twiml("No destination configured for this number.")
+MISSING_CUSTOMER_TWIML = say_twiml("Customer number missing. Goodbye.")
+INBOUND_A_TWIML = dial_twiml(CFG.number_a, CFG.number_b) if CFG.number_b else NO_DESTINATION_TWIML
+# Calls to B are answered with an empty response (no Dial) when A is configured
+INBOUND_B_TWIML = f"{TWIML_DECLARATION}<Response />" if CFG.number_a else NO_DESTINATION_TWIML
+# Only the customer number varies; fill it in with str.format after escaping it
+BRIDGE_TWIML_TEMPLATE = dial_twiml(CFG.number_a, "{customer}")
+
+
 @app.route("/api/voice/bridge", methods=["GET", "POST"])
 def voice_bridge() -> Response:
     """TwiML: once the agent answers, dial out to the customer and bridge."""
-    customer = (request.values.get("customer") or "").strip()
-    vr = VoiceResponse()
+    # Look in the query string, then the POST body, without building request.values
+    customer = request.args.get("customer")
+    if not customer and request.method == "POST":
+        customer = request.form.get("customer")
+    customer = (customer or "").strip()
     if not customer:
-        vr.say("Customer number missing. Goodbye.")
-        return Response(str(vr), mimetype="text/xml")
+        return Response(MISSING_CUSTOMER_TWIML, mimetype="text/xml")
 
-    dial = Dial(caller_id=TWILIO_NUMBER_A)
-    dial.number(customer)
-    vr.append(dial)
-    return Response(str(vr), mimetype="text/xml")
+    return Response(BRIDGE_TWIML_TEMPLATE.format(customer=escape(customer)), mimetype="text/xml")
 
 
 @app.post("/api/voice/incoming/a")
 def inbound_a() -> Response:
     """Webhook for incoming calls to TWILIO_NUMBER_A."""
-    from_num = request.form.get("From", "")
-    to_num = request.form.get("To", "")
-    sid = request.form.get("CallSid", "")
+    form = request.form
+    from_num = form.get("From", "")
+    to_num = form.get("To", "")
+    sid = form.get("CallSid", "")
     broadcast_event("incoming_call", {"to": to_num, "from": from_num, "sid": sid, "which": "A"})
-
-    vr = VoiceResponse()
-    if TWILIO_NUMBER_B:
-        dial = Dial(caller_id=TWILIO_NUMBER_A)
-        dial.number(TWILIO_NUMBER_B)
-        vr.append(dial)
-    else:
-        vr.say("No destination configured for this number.")
-    return Response(str(vr), mimetype="text/xml")
+    return Response(INBOUND_A_TWIML, mimetype="text/xml")
 
 
 @app.post("/api/voice/incoming/b")
 def inbound_b() -> Response:
     """Webhook for incoming calls to TWILIO_NUMBER_B."""
-    from_num = request.form.get("From", "")
-    to_num = request.form.get("To", "")
-    sid = request.form.get("CallSid", "")
+    form = request.form
+    from_num = form.get("From", "")
+    to_num = form.get("To", "")
+    sid = form.get("CallSid", "")
     broadcast_event("incoming_call", {"to": to_num, "from": from_num, "sid": sid, "which": "B"})
-
-    vr = VoiceResponse()
-    if TWILIO_NUMBER_A:
-        dial = Dial(caller_id=TWILIO_NUMBER_B)
-        dial.number(TWILIO_NUMBER_A)
-    else:
-        vr.say("No destination configured for this number.")
-    return Response(str(vr), mimetype="text/xml")
+    return Response(INBOUND_B_TWIML, mimetype="text/xml")
 
 
 @app.post("/api/voice/status")
 def status_callback() -> Response:
+    form = request.form
     payload = {
-        "CallSid": request.form.get("CallSid"),
-        "CallStatus": request.form.get("CallStatus"),
-        "To": request.form.get("To"),
-        "From": request.form.get("From"),
-        "Timestamp": request.form.get("Timestamp"),
+        "CallSid": form.get("CallSid"),
+        "CallStatus": form.get("CallStatus"),
+        "To": form.get("To"),
+        "From": form.get("From"),
+        "Timestamp": form.get("Timestamp"),
     }
     broadcast_event("call_status", payload)
     return ("", 204)
@@ -309,23 +579,20 @@ def status_callback() -> Response:
 @app.get("/api/twilio/status")
 def twilio_status() -> Response:
     """Get detailed Twilio connection status"""
-    is_connected, message = twilio_manager.test_connection()
+    is_connected, message = twilio_manager.connection_status()
     
-    return jsonify({
+    return static_json_response(TWILIO_STATUS_STATIC_JSON, {
         "connected": is_connected,
         "message": message,
         "current_auth_method": twilio_manager.get_auth_method(),
-        "primary_client_available": bool(twilio_manager.primary_client),
-        "fallback_client_available": bool(twilio_manager.fallback_client),
-        "account_sid_configured": bool(TWILIO_ACCOUNT_SID),
-        "api_key_configured": bool(TWILIO_API_KEY_SID and TWILIO_API_KEY_SECRET),
-        "auth_token_configured": bool(TWILIO_AUTH_TOKEN)
     })
 
 
 def run_app():
-    # Bind on all interfaces so ngrok can tunnel
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py).
+    # Bind on all interfaces so ngrok can tunnel.
+    # The debugger/reloader is opt-in since it forks a second copy of the app.
+    app.run(host="0.0.0.0", port=5000, debug=os.getenv("FLASK_DEBUG") == "1")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+# Gunicorn settings for serving the backend in production:
+#   cd backend
+#   gunicorn app:app
+#
+# gevent workers turn every blocking socket call (Twilio REST requests, open SSE
+# streams) into a cooperative wait, so one worker can hold many in-flight Twilio
+# calls and dashboard connections at once. Gunicorn monkey-patches the worker
+# before loading app.py, so the app needs no gevent-specific code.
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:5000")
+worker_class = "gevent"
+# Keep a single worker: SSE subscribers and the event dispatcher live in process
+# memory, so a webhook handled in one worker would never reach streams held by another.
+workers = 1
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "200"))
+# timeout is left at gunicorn's default: gevent workers heartbeat from their own
+# loop, so long-lived SSE streams don't trip it, and hung-worker detection stays on.
@@ -15,6 +15,17 @@ from dotenv import load_dotenv
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioException, TwilioRestException
 
+# Every setting the app reads for Twilio, in display order
+ENV_KEYS = (
+    'TWILIO_ACCOUNT_SID',
+    'TWILIO_AUTH_TOKEN',
+    'TWILIO_API_KEY_SID',
+    'TWILIO_API_KEY_SECRET',
+    'TWILIO_NUMBER_A',
+    'TWILIO_NUMBER_B',
+)
+SECRET_KEYS = ('TWILIO_AUTH_TOKEN', 'TWILIO_API_KEY_SECRET')
+
 def load_environment():
     """Load environment variables from .env file"""
     # Try to load from current directory first
@@ -30,8 +41,22 @@ def load_environment():
         return False
     return True
 
-def test_credentials():
+def read_environment():
+    """Read all Twilio settings in one pass ('' when unset)"""
+    return {key: os.environ.get(key, '') for key in ENV_KEYS}
+
+def format_environment(env):
+    """Format the settings as one block, masking secrets"""
+    lines = []
+    for key, value in env.items():
+        if value and key in SECRET_KEYS:
+            value = '*' * len(value)
+        lines.append(f"{key}: {value or 'NOT SET'}")
+    return "\n".join(lines)
+
+def test_credentials(env=None):
     """Test Twilio credentials and return results"""
+    env = env or read_environment()
     results = {
         'account_sid': False,
         'api_key': False,
@@ -42,20 +67,17 @@ def test_credentials():
     }
     
     # Check Account SID
-    account_sid = os.getenv('TWILIO_ACCOUNT_SID')
+    account_sid = env['TWILIO_ACCOUNT_SID']
     if account_sid:
         results['account_sid'] = True
-        print(f"✓ Account SID: {account_sid[:10]}...")
     else:
         results['errors'].append("TWILIO_ACCOUNT_SID not found")
-        print("✗ Account SID: Not configured")
     
     # Test Auth Token authentication (Primary method)
-    auth_token = os.getenv('TWILIO_AUTH_TOKEN')
+    auth_token = env['TWILIO_AUTH_TOKEN']
     
     if auth_token:
         results['auth_token'] = True
-        print(f"✓ Auth Token: {'*' * len(auth_token)}")
         
         try:
             client = Client(account_sid, auth_token)
@@ -74,16 +96,14 @@ def test_credentials():
             results['errors'].append(f"Auth Token error: {str(e)}")
             print(f"✗ Auth Token authentication: FAILED - {str(e)}")
     else:
-        print("⚠ Auth Token: Not configured (primary method)")
+        print("⚠ Auth Token authentication: SKIPPED - not configured (primary method)")
     
     # Test API Key authentication (Fallback method)
-    api_key_sid = os.getenv('TWILIO_API_KEY_SID')
-    api_key_secret = os.getenv('TWILIO_API_KEY_SECRET')
+    api_key_sid = env['TWILIO_API_KEY_SID']
+    api_key_secret = env['TWILIO_API_KEY_SECRET']
     
     if api_key_sid and api_key_secret:
         results['api_key'] = True
-        print(f"✓ API Key SID: {api_key_sid[:10]}...")
-        print(f"✓ API Key Secret: {'*' * len(api_key_secret)}")
         
         try:
             client = Client(api_key_sid, api_key_secret, account_sid)
@@ -102,26 +122,15 @@ def test_credentials():
             results['errors'].append(f"API Key error: {str(e)}")
             print(f"✗ API Key authentication: FAILED - {str(e)}")
     else:
-        print("⚠ API Key: Not configured (fallback method)")
+        print("⚠ API Key authentication: SKIPPED - not configured (fallback method)")
     
     return results
 
-def test_phone_numbers():
+def test_phone_numbers(env=None):
     """Test if phone numbers are configured"""
-    print("\n📞 Phone Number Configuration:")
-    
-    number_a = os.getenv('TWILIO_NUMBER_A')
-    number_b = os.getenv('TWILIO_NUMBER_B')
-    
-    if number_a:
-        print(f"✓ Number A: {number_a}")
-    else:
-        print("✗ Number A: Not configured")
-    
-    if number_b:
-        print(f"✓ Number B: {number_b}")
-    else:
-        print("✗ Number B: Not configured")
+    env = env or read_environment()
+    number_a = env['TWILIO_NUMBER_A']
+    number_b = env['TWILIO_NUMBER_B']
     
     if not number_a and not number_b:
         print("⚠ Warning: No phone numbers configured. Calls will not work.")
@@ -171,11 +180,18 @@ def main():
         print("\n❌ Cannot proceed without environment configuration")
         sys.exit(1)
     
+    env = read_environment()
+    
+    # Show every setting in one block before testing
+    print("\n⚙ Configuration:")
+    print(format_environment(env))
+    print()
+    
     # Test credentials
-    results = test_credentials()
+    results = test_credentials(env)
     
     # Test phone numbers
-    test_phone_numbers()
+    test_phone_numbers(env)
     
     # Print summary
     print_summary(results)
@@ -1,26 +1,29 @@
+"""
+Quick environment check: prints which Twilio settings are configured.
+
+Shares its settings list with test_auth.py; run that script to verify
+the credentials against Twilio.
+
+Usage:
+    python test_env.py
+"""
+
 import os
 from dotenv import load_dotenv
 
+from test_auth import format_environment, read_environment
+
 # Load environment variables from project root .env if present
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", ".env"))
 
+env = read_environment()
+
 print("Environment Variables Check:")
 print("=" * 40)
-print(f"TWILIO_ACCOUNT_SID: {os.getenv('TWILIO_ACCOUNT_SID', 'NOT SET')}")
-print(f"TWILIO_API_KEY_SID: {os.getenv('TWILIO_API_KEY_SID', 'NOT SET')}")
-print(f"TWILIO_API_KEY_SECRET: {os.getenv('TWILIO_API_KEY_SECRET', 'NOT SET')}")
-print(f"TWILIO_NUMBER_A: {os.getenv('TWILIO_NUMBER_A', 'NOT SET')}")
-print(f"TWILIO_NUMBER_B: {os.getenv('TWILIO_NUMBER_B', 'NOT SET')}")
+print(format_environment(env))
 print("=" * 40)
 
-# Check if we can create a Twilio client
-try:
-    from twilio.rest import Client
-    if os.getenv('TWILIO_ACCOUNT_SID') and os.getenv('TWILIO_API_KEY_SID') and os.getenv('TWILIO_API_KEY_SECRET'):
-        client = Client(os.getenv('TWILIO_API_KEY_SID'), os.getenv('TWILIO_API_KEY_SECRET'), os.getenv('TWILIO_ACCOUNT_SID'))
-        print("✅ Twilio client created successfully!")
-    else:
-        print("❌ Missing required Twilio environment variables")
-except Exception as e:
-    print(f"❌ Error creating Twilio client: {e}")
-
+if env['TWILIO_ACCOUNT_SID'] and (env['TWILIO_AUTH_TOKEN'] or (env['TWILIO_API_KEY_SID'] and env['TWILIO_API_KEY_SECRET'])):
+    print("✅ Twilio credentials are set. Run 'python test_auth.py' to verify them.")
+else:
+    print("❌ Missing required Twilio environment variables")